@@ -16,6 +16,8 @@
 # (mVc) View widgets have references on the models to display their data.
 # (mVc) Action widgets have references on the controllers to propagate user actions.
 
+import functools
+from contextlib import contextmanager
 import tkinter as tk
 from tkinter import ttk
 
@@ -23,70 +25,130 @@ class Observable:
     """
     Generic observable behaviour
     """
+    # slot storage: no per-instance __dict__, and slot descriptors resolve
+    # faster than dict lookups on the hot _observers accesses
+    __slots__ = ('_observers', '_batch_depth', '_batch_pending')
+
     def __init__(self):
-        self._observers = []
+        # dict used as an ordered set: O(1) unsubscribe and no duplicate subscriptions
+        self._observers = {}
+        self._batch_depth = 0
+        self._batch_pending = None
 
     def subscribe(self, observer):
-        self._observers.append(observer)
-
-    def notify_observers(self, *args, **kwargs):
-        for observer in self._observers:
-            observer(self, *args, **kwargs)
+        # Hot-path contract: observers are plain callables invoked as
+        # callback(model, ...) on every notification. Bound methods are
+        # unwrapped into a partial over the underlying function, which CPython
+        # dispatches slightly faster than a method object; functions, closures
+        # and partials are stored as-is. The observer as passed in stays the
+        # key so unsubscribe(observer) still matches.
+        func = getattr(observer, '__func__', None)
+        if func is not None:
+            callback = functools.partial(func, observer.__self__)
+        else:
+            callback = observer
+        self._observers[observer] = callback
+
+    def notify_observers(self):
+        # no-payload fast path: the dominant case, spared the *args/**kwargs
+        # tuple and dict allocation of notify_observers_ex
+        if self._batch_depth:
+            self._batch_pending = ((), {})
+            return
+        # iterate a snapshot so observers may (un)subscribe during delivery
+        for callback in tuple(self._observers.values()):
+            callback(self)
+
+    def notify_observers_ex(self, *args, **kwargs):
+        if self._batch_depth:
+            # remember the latest payload; the outermost batch exit delivers it
+            self._batch_pending = (args, kwargs)
+            return
+        for callback in tuple(self._observers.values()):
+            callback(self, *args, **kwargs)
+
+    @contextmanager
+    def batch(self):
+        # coalesce notifications issued inside the block into a single one on
+        # exit; reentrant, only the outermost batch fires
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0 and self._batch_pending is not None:
+                args, kwargs = self._batch_pending
+                self._batch_pending = None
+                self.notify_observers_ex(*args, **kwargs)
 
     def unsubscribe(self, observer):
-        self._observers.remove(observer)
+        self._observers.pop(observer, None)
 
 
-class Score(Observable):
-    def __init__(self, value):
-        Observable.__init__(self)
-        self.value = value
+class Score:
+    # The score state lives in a tk.IntVar, so observation happens at Tcl
+    # level: widgets bound with textvariable (or a variable trace) are updated
+    # natively, without the Python notify loop and per-observer call dispatch
+    # the Observable machinery costs. Needs a master, hence created after Tk().
+    __slots__ = ('var',)
+
+    def __init__(self, master, value):
+        self.var = tk.IntVar(master=master, value=value)
 
     @property
     def value(self):
-        return self.__value
+        return self.var.get()
 
     @value.setter
     def value(self, value):
-        self.__value = value
+        # redundant writes would otherwise fan out a Tcl trace round-trip
+        if value == self.var.get():
+            return
         print(f"Score#value=: {value}")
 
-        self.notify_observers()
+        self.var.set(value)
 
 
 class User(Observable):
+    # Plain slot attributes: the property setters did nothing but assign, so their
+    # descriptor dispatch and the per-instance __dict__ were pure overhead.
+    # Keep properties only when the setter really works (as Score does to notify).
+    __slots__ = ('firstname', 'lastname', 'email', '_snapshot', '_display')
+
     def __init__(self):
         Observable.__init__(self)
+        self.firstname = None
+        self.lastname = None
+        self.email = None
+        self._snapshot = None
+        self._display = None
 
     @property
-    def firstname(self):
-        return self.__firstname
-
-    @firstname.setter
-    def firstname(self, value):
-        self.__firstname = value
-
-    @property
-    def lastname(self):
-        return self.__lastname
-
-    @lastname.setter
-    def lastname(self, value):
-        self.__lastname = value
-
-    @property
-    def email(self):
-        return self.__email
+    def display(self):
+        # Hand-rolled cached property: functools.cached_property stores on the
+        # instance __dict__, which __slots__ removed, so the computed string is
+        # cached in a slot instead and invalidated by save() when fields
+        # changed. .upper() runs once per distinct state, not once per render.
+        display = self._display
+        if display is None:
+            display = f"{self.firstname} {self.lastname.upper()} ({self.email})"
+            self._display = display
+        return display
 
-    @email.setter
-    def email(self, value):
-        self.__email = value
-        
     def save(self):
         # Do whatever should be done to persist this user
         print(f"User#save(): {self.firstname} {self.lastname} {self.email}")
 
-        self.notify_observers()
+        # tell observers which fields actually changed since the last save so
+        # views rendering other fields can skip their refresh
+        current = {'firstname': self.firstname, 'lastname': self.lastname, 'email': self.email}
+        snapshot = self._snapshot
+        changed = {field for field, value in current.items()
+                   if snapshot is None or snapshot[field] != value}
+        self._snapshot = current
+        if changed:
+            self._display = None
+        self.notify_observers_ex(changed=changed)
 
 
 # This is a View kind widget
@@ -95,19 +157,14 @@ class ScoreViewWidget(ttk.Frame):
         super().__init__(parent)
         self.model = model
         
-        # bind
-        self.model.subscribe(self.on_model_changed)
-
-        # create widgets
+        # create widgets; the label tracks the model's IntVar natively, no
+        # Python-side subscription or handler needed
         label = ttk.Label(self, text='Score:')
         label.grid(row=0, column=0, sticky=tk.W)
 
-        self.score_label = ttk.Label(self, text=str(self.model.value))
+        self.score_label = ttk.Label(self, textvariable=model.var)
         self.score_label.grid(row=0, column=1, sticky=tk.W)
 
-    def on_model_changed(self, model):
-        self.score_label.config(text=str(model.value))
-
 
 # This is an Action kind widget
 class ScoreUpdaterWidget(ttk.Frame):
@@ -120,15 +177,36 @@ class ScoreUpdaterWidget(ttk.Frame):
         self.decrement_button = ttk.Button(self, text="-", command=self.decrement)
         self.decrement_button.grid(row=0, column=1)
 
+        self._pending_delta = 0
+        self._flush_scheduled = False
+
     def increment(self):
-        self.controller.increment()
+        self._pending_delta += 1
+        self._schedule_flush()
 
     def decrement(self):
-        self.controller.decrement()
+        self._pending_delta -= 1
+        self._schedule_flush()
+
+    def _schedule_flush(self):
+        # coalesce rapid-fire clicks: the model (and thus the views) updates at
+        # most ~60 times per second however fast the buttons repeat
+        if not self._flush_scheduled:
+            self._flush_scheduled = True
+            self.after(16, self._flush)
+
+    def _flush(self):
+        self._flush_scheduled = False
+        delta = self._pending_delta
+        self._pending_delta = 0
+        if delta:
+            self.controller.change_by(delta)
 
 
 # This is a View kind widget
 class UserViewWidget(ttk.Frame):
+    _FIELDS = frozenset(('firstname', 'lastname', 'email'))
+
     def __init__(self, parent, model):
         super().__init__(parent)
         self.model = model
@@ -142,12 +220,39 @@ class UserViewWidget(ttk.Frame):
 
         self.user_label = ttk.Label(self)
         self.user_label.grid(row=0, column=1, sticky=tk.W)
+        self._last_text = None
+        # pre-resolved Tcl path and call: skips ttk configure's keyword parsing
+        # and option translation on the hot notification path
+        widget_path = str(self.user_label)
+        call = self.tk.call
+        self._set_user_text = lambda text: call(widget_path, 'configure', '-text', text)
+        self._pending = None
+        self._apply_scheduled = False
+
+    def on_model_changed(self, model, changed=None):
+        # field-typed notification: nothing to re-render when none of the
+        # fields this view shows changed
+        if changed is not None and not (changed & self._FIELDS):
+            return
+        # defer to idle time: several notifications inside one Tk event
+        # collapse into a single label update
+        self._pending = self.format_user(model)
+        if not self._apply_scheduled:
+            self._apply_scheduled = True
+            self.after_idle(self._apply_pending)
+
+    def _apply_pending(self):
+        self._apply_scheduled = False
+        text = self._pending
+        # don't touch the label (and trigger a Tk redraw) for an unchanged render
+        if text == self._last_text:
+            return
+        self._last_text = text
+        self._set_user_text(text)
 
-    def on_model_changed(self, model):
-        self.user_label.config(text=self.format_user(model))
-        
     def format_user(self, model):
-        return f"{model.firstname} {model.lastname.upper()} ({model.email})"
+        # the derived string is computed and cached model-side, see User.display
+        return model.display
 
 
 # This is an Action kind widget
@@ -175,11 +280,12 @@ class UserEditWidget(ttk.Frame):
         self.save_button = ttk.Button(self, text="Save", command=self.on_save_button_clicked)
         self.save_button.grid(row=3, column=1, sticky=tk.E)
 
+        self._entries = (self.firstname_entry, self.lastname_entry, self.email_entry)
+
     def on_save_button_clicked(self):
         self.controller.save(self.firstname_entry.get(), self.lastname_entry.get(), self.email_entry.get())
-        self.firstname_entry.delete(0, tk.END)
-        self.lastname_entry.delete(0, tk.END)
-        self.email_entry.delete(0, tk.END)
+        for entry in self._entries:
+            entry.delete(0, tk.END)
 
 
 # This is a hybrid kind widget!!!
@@ -191,27 +297,50 @@ class ScoreEditWidget(ttk.Frame):
         self.model = model
         self.controller = controller
         
-        # bind
-        self.model.subscribe(self.on_model_changed)
+        # bind at Tcl level: the variable trace replaces the Python-side
+        # Observable subscription
+        self.model.var.trace_add('write', self.on_var_written)
 
         # create widgets
         label = ttk.Label(self, text='Score:')
         label.grid(row=0, column=0, sticky=tk.W)
 
-        self.score_value = tk.StringVar(value=str(self.model.value))
-        self.score_entry = ttk.Entry(self, textvariable=self.score_value, width=10, validate="focusout", validatecommand=self.on_score_entry_changed)
+        # no textvariable: a programmatic StringVar.set would round-trip through
+        # the Tcl variable-trace machinery on every model change
+        self.score_entry = ttk.Entry(self, width=10, validate="focusout", validatecommand=self.on_score_entry_changed)
+        self.score_entry.insert(0, str(self.model.value))
         self.score_entry.grid(row=0, column=1, sticky=tk.W)
-
-    def on_model_changed(self, model):
-        self.score_value.set(str(model.value))
+        # hoisted: the validate callback calls this on every focus-out
+        self._get_entry_text = self.score_entry.get
+        self._pending = None
+        self._apply_scheduled = False
+
+    def on_var_written(self, *_):
+        # defer to idle time: several var writes inside one Tk event collapse
+        # into a single entry rewrite
+        self._pending = self.model.value
+        if not self._apply_scheduled:
+            self._apply_scheduled = True
+            self.after_idle(self._apply_pending)
+
+    def _apply_pending(self):
+        self._apply_scheduled = False
+        # turn validation off while rewriting so Tk does not fire
+        # on_score_entry_changed for the programmatic update
+        self.score_entry.configure(validate='none')
+        try:
+            self.score_entry.delete(0, tk.END)
+            self.score_entry.insert(0, str(self._pending))
+        finally:
+            self.score_entry.configure(validate='focusout')
 
     def on_score_entry_changed(self):
-        try:
-            self.controller.try_change_value(int(self.score_value.get()))
+        # cheap precheck instead of paying ValueError construction on typos,
+        # the common case for a focus-out validation
+        text = self._get_entry_text().strip()
+        if text.removeprefix('-').isdecimal():
+            self.controller.try_change_value(int(text))
 
-        except ValueError as error:
-            pass
-        
         return True
 
 
@@ -225,6 +354,9 @@ class ScoreController:
     def decrement(self):
         self.model.value -= 1
 
+    def change_by(self, delta):
+        self.model.value += delta
+
     def try_change_value(self, new_value):
         self.model.value = new_value
     
@@ -234,10 +366,11 @@ class UserController:
         self.model = model
         
     def save(self, firstname, lastname, email):
-        self.model.firstname = firstname
-        self.model.lastname = lastname
-        self.model.email = email
-        self.model.save()
+        with self.model.batch():
+            self.model.firstname = firstname
+            self.model.lastname = lastname
+            self.model.email = email
+            self.model.save()
     
 
 class App(tk.Tk):
@@ -247,25 +380,25 @@ class App(tk.Tk):
         self.title('Tkinter UsefullMVC Demo')
 
         # create the models
-        score = Score(3)
+        score = Score(self, 3)
         user = User()
 
-        # create a single score controller linked to the model
+        # create a single controller per model, shared by the related widgets
         score_controller = ScoreController(score)
-        # create all score related widgets using the same controller
-        widget = ScoreEditWidget(self, score, score_controller)
-        widget.grid(row=0, column=0, columnspan=2, padx=10, pady=10, sticky=tk.W)
-        widget = ScoreViewWidget(self, score)
-        widget.grid(row=1, column=0, padx=10, pady=10, sticky=tk.W)
-        widget = ScoreUpdaterWidget(self, score_controller)
-        widget.grid(row=1, column=1, padx=10, pady=10, sticky=tk.W)
-
-        # create user controller and widgets
         user_controller = UserController(user)
-        widget = UserViewWidget(self, user)
-        widget.grid(row=2, column=0, columnspan=2, padx=10, pady=10, sticky=tk.W)
-        widget = UserEditWidget(self, user_controller)
-        widget.grid(row=3, column=0, columnspan=2, padx=10, pady=10, sticky=tk.W)
+
+        # create all widgets from a construction table: one loop body instead
+        # of five unrolled create/grid blocks, sharing the base grid options
+        base = dict(padx=10, pady=10, sticky=tk.W)
+        specs = (
+            (ScoreEditWidget, (score, score_controller), dict(row=0, column=0, columnspan=2)),
+            (ScoreViewWidget, (score,), dict(row=1, column=0)),
+            (ScoreUpdaterWidget, (score_controller,), dict(row=1, column=1)),
+            (UserViewWidget, (user,), dict(row=2, column=0, columnspan=2)),
+            (UserEditWidget, (user_controller,), dict(row=3, column=0, columnspan=2)),
+        )
+        for widget_class, args, grid_kwargs in specs:
+            widget_class(self, *args).grid(**base, **grid_kwargs)
 
 
 if __name__ == '__main__':